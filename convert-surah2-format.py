@@ -27,7 +27,7 @@ for verse in all_verses:
         'arabic': verse['arabic'],
         'transliteration': verse['transliteration'],
         'translation': verse['translation'],
-        'recitationUrl': f'https://everyayah.com/data/Nasser_Alqatami_128kbps/002{verse["verse"]:03d}.mp3',
+        # No recitationUrl: the app derives it from reciters.json at load time
         'words': []
     }
 
@@ -66,19 +66,15 @@ print(f"        surahName: \"{surah_2_data['surahName']}\",")
 print("        ayat: [")
 
 for i, ayah in enumerate(surah_2_data['ayat']):
+    # json.dumps keeps quotes/apostrophes inside the text escaped (valid JS string literals)
     print(f"            {{ ayahNumber: {ayah['ayahNumber']}, ", end='')
-    print(f"arabic: '{ayah['arabic']}', ", end='')
-    print(f"transliteration: '{ayah['transliteration']}', ", end='')
-    print(f"translation: '{ayah['translation']}', ", end='')
-    print(f"recitationUrl: '{ayah['recitationUrl']}', ", end='')
+    print(f"arabic: {json.dumps(ayah['arabic'], ensure_ascii=False)}, ", end='')
+    print(f"transliteration: {json.dumps(ayah['transliteration'], ensure_ascii=False)}, ", end='')
+    print(f"translation: {json.dumps(ayah['translation'], ensure_ascii=False)}, ", end='')
     print("words: [")
 
     for j, word in enumerate(ayah['words']):
-        # Escape single quotes in strings
-        word_str = json.dumps(word).replace('"', "'").replace("'", "\\'")
-        # Convert back to use single quotes for the object
-        word_str = word_str.replace("\\'", "'")
-        word_str = "{" + word_str[1:-1] + "}"  # Keep object brackets
+        word_str = json.dumps(word, ensure_ascii=False)
 
         comma = "," if j < len(ayah['words']) - 1 else ""
         print(f"                {word_str}{comma}")
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Extract structured grammar tags from the free-text grammar fields.
+
+Parses the category label of each word's `grammar.type` string (the text
+outside any parentheses) into a fixed set of one-bit part-of-speech flags;
+tense/voice flags come from the label too, or for verbs from the whole type
+plus `tense`, `voice` and `mood`. The `case`, `mood`, `person` and `number` fields become 2-bit
+fields, all packed into one unsigned 32-bit integer per word so the client can
+filter with a bitwise AND. Strings that yield no part of speech are reported.
+
+Output: <out>/vocabulary.json and <out>/<surah>.json ({"verses": [...],
+"masks": [[word mask, ...] per ayah]}).
+
+Usage: python3 extract-grammar-tags.py [--out public/data/tags] [--report unparsed.json]
+"""
+
+import argparse
+import json
+import re
+from collections import Counter
+from pathlib import Path
+
+from quran_data import ROOT, load_corpus
+
+# One bit each; a word may carry several (e.g. "Harf + Ism - Preposition + Noun")
+FLAGS = (
+    'VERB', 'NOUN', 'PARTICLE', 'PRONOUN', 'PROPER_NOUN', 'ADJECTIVE', 'PARTICIPLE',
+    'VERBAL_NOUN', 'PREPOSITION', 'CONJUNCTION', 'NEGATION', 'RELATIVE',
+    'DEMONSTRATIVE', 'INTERROGATIVE', 'CONDITIONAL', 'EMPHATIC', 'VOCATIVE',
+    'EXCEPTION', 'ADVERB', 'INITIALS', 'PAST', 'PRESENT', 'IMPERATIVE', 'PASSIVE',
+)
+FLAG_BITS = {name: 1 << i for i, name in enumerate(FLAGS)}
+
+# Mutually exclusive values, stored as 2-bit fields above the flags (0 = unknown).
+# Flags + fields use exactly 32 bits: read fields with >>> in JavaScript.
+FIELDS = {
+    'case': ('NOMINATIVE', 'ACCUSATIVE', 'GENITIVE'),
+    'mood': ('INDICATIVE', 'SUBJUNCTIVE', 'JUSSIVE'),
+    'person': ('FIRST', 'SECOND', 'THIRD'),
+    'number': ('SINGULAR', 'DUAL', 'PLURAL'),
+}
+FIELD_SHIFTS = {name: len(FLAGS) + 2 * i for i, name in enumerate(FIELDS)}
+
+POS_FLAGS = FLAGS[:FLAGS.index('INITIALS') + 1]
+TENSE_FLAGS = FLAGS[FLAGS.index('PAST'):]
+
+FLAG_PATTERNS = {
+    'VERB': r'\bfi[ʿ\']?l\b|\bverb\b',
+    'NOUN': r'\bism\b|\bnoun\b|naming word',
+    'PARTICLE': r'\bharf\b|\bparticle\b',
+    'PRONOUN': r'pronoun|\bḍamīr\b|\bdamir\b',
+    'PROPER_NOUN': r'proper (noun|name)',
+    'ADJECTIVE': r'adjective|describing word|\bṣifa',
+    'PARTICIPLE': r'participle|ism f[āa]ʿ?il|ism maf[ʿ\']?ūl',
+    # Not the Ḥarf Maṣdarī / maṣdar particles, which are particles
+    'VERBAL_NOUN': r'verbal noun|ma[sṣ]dar(?![īi]|\s*particle)',
+    'PREPOSITION': r'preposition',
+    'CONJUNCTION': r'conjunction|joining word|\bʿaṭf\b',
+    'NEGATION': r'negat',
+    'RELATIVE': r'relative',
+    'DEMONSTRATIVE': r'demonstrative|pointing word',
+    'INTERROGATIVE': r'interrogative|question',
+    'CONDITIONAL': r'condition',
+    'EMPHATIC': r'emphatic|emphasi|\binna\b',
+    'VOCATIVE': r'vocative|calling',
+    'EXCEPTION': r'exception',
+    'ADVERB': r'adverb|\bẓarf\b|\bzarf\b',
+    'INITIALS': r'muqa[tṭ][tṭ]a|initial',
+    'PAST': r'\bpast\b|\bmāḍī\b|\bmadi\b',
+    'PRESENT': r'\bpresent\b|\bmuḍāriʿ|\bmudari',
+    'IMPERATIVE': r'imperative|command|\bamr\b',
+    'PASSIVE': r'passive|majhūl',
+}
+VALUE_PATTERNS = {
+    'NOMINATIVE': r'nominative|marf[ūu]',
+    'ACCUSATIVE': r'accusative|man[sṣ][ūu]b',
+    'GENITIVE': r'genitive|majr[ūu]r',
+    'INDICATIVE': r'indicative',
+    'SUBJUNCTIVE': r'subjunctive',
+    'JUSSIVE': r'jussive|majz[ūu]m',
+    'FIRST': r'first person|\bwe\b',
+    'SECOND': r'second person|\byou\b',
+    'THIRD': r'third person|\bhe\b|\bshe\b|\bthey\b',
+    'SINGULAR': r'singular',
+    'DUAL': r'\bdual\b',
+    'PLURAL': r'plural',
+}
+FLAG_RE = {k: re.compile(v, re.I) for k, v in FLAG_PATTERNS.items()}
+VALUE_RE = {k: re.compile(v, re.I) for k, v in VALUE_PATTERNS.items()}
+
+# Parenthesised glosses ("Noun (object of implied verb)") describe, they don't categorise
+GLOSS = re.compile(r'\([^)]*\)?')
+
+# Which grammar fields feed a verb's tense/voice flags and each 2-bit field, in priority order.
+# Part-of-speech flags come from the type's category label alone.
+TENSE_SOURCES = ('tense', 'voice', 'mood')
+FIELD_SOURCES = {
+    'case': ('case', 'type'),
+    'mood': ('mood',),
+    'person': ('person',),
+    'number': ('number', 'person'),
+}
+
+
+def parse_field(values, text):
+    """Index (1-3) of the value mentioned earliest in text, or 0."""
+    best, best_pos = 0, None
+    for i, value in enumerate(values, 1):
+        match = VALUE_RE[value].search(text)
+        if match and (best_pos is None or match.start() < best_pos):
+            best, best_pos = i, match.start()
+    return best
+
+
+def word_mask(grammar):
+    """Pack one word's grammar dict into an int; also return whether it had a part of speech."""
+    mask = 0
+    category = GLOSS.sub(' ', str(grammar.get('type', '')))
+    for name in POS_FLAGS:
+        if FLAG_RE[name].search(category):
+            mask |= FLAG_BITS[name]
+    # Glosses and secondary fields only describe verbs ("Noun (subject of passive verb)" isn't passive)
+    tense_text = category
+    if mask & FLAG_BITS['VERB']:
+        tense_text = ' | '.join(str(grammar[k]) for k in ('type',) + TENSE_SOURCES if grammar.get(k))
+    for name in TENSE_FLAGS:
+        if FLAG_RE[name].search(tense_text):
+            mask |= FLAG_BITS[name]
+    for field, values in FIELDS.items():
+        for source in FIELD_SOURCES[field]:
+            value = parse_field(values, str(grammar.get(source, '')))
+            if value:
+                mask |= value << FIELD_SHIFTS[field]
+                break
+    parsed = any(mask & FLAG_BITS[name] for name in POS_FLAGS)
+    return mask, parsed
+
+
+def vocabulary():
+    return {
+        'flags': FLAG_BITS,
+        'fields': {
+            name: {'shift': FIELD_SHIFTS[name], 'values': {v: i for i, v in enumerate(values, 1)}}
+            for name, values in FIELDS.items()
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pack grammar tags into per-word bitmasks.')
+    parser.add_argument('--out', default=str(ROOT / 'public' / 'data' / 'tags'), help='output directory')
+    parser.add_argument('--report', help='write unparseable type strings with counts to this JSON file')
+    args = parser.parse_args()
+
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / 'vocabulary.json').write_text(json.dumps(vocabulary(), indent=2))
+
+    unparsed = Counter()
+    total = 0
+    for number, surah in load_corpus(include_inline=True).items():
+        masks = []
+        for verse in surah['verses']:
+            ayah_masks = []
+            for word in verse['words']:
+                mask, parsed = word_mask(word.get('grammar', {}))
+                if not parsed:
+                    unparsed[word.get('grammar', {}).get('type', '')] += 1
+                ayah_masks.append(mask)
+            masks.append(ayah_masks)
+            total += len(ayah_masks)
+        data = {'surah': number, 'verses': [v['verse'] for v in surah['verses']], 'masks': masks}
+        (out_dir / f'{number}.json').write_text(json.dumps(data, separators=(',', ':')))
+
+    print(f"Tagged {total} words; {sum(unparsed.values())} without a part of speech")
+    for text, count in unparsed.most_common(20):
+        print(f"  {count:>4}  {text!r}")
+    if args.report:
+        Path(args.report).write_text(json.dumps(dict(unparsed.most_common()), ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pre-render lightweight HTML pages per surah from the grammar chunks.
+
+Each page is the app's index.html with the surah's Arabic text, translation and
+word glosses already inside <div id="root">, so text paints before the React
+bundle has loaded; the app then takes over the same root element.
+
+Output: <out>/surah/<n>/index.html with the whole surah or, with --page-size,
+one page per block of ayat at <out>/surah/<n>/<page>/index.html and the first
+block as the surah's landing page. Surahs are rendered in parallel and skipped
+when neither their data nor the template changed since last run.
+
+Usage: python3 generate-static-pages.py [--out dist] [--page-size N] [--jobs N] [--force]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from html import escape
+from pathlib import Path
+
+from quran_data import ROOT, load_corpus
+
+# Bump when the markup changes so every page is regenerated
+GENERATOR_VERSION = 2
+MANIFEST_NAME = '.static-pages.json'
+
+
+def render_ayah(verse):
+    words = '\n'.join(
+        f'<div class="card"><div class="card-header">'
+        f'<h2 class="arabic-word">{escape(w["arabic"])}</h2>'
+        f'<p class="meta"><em>{escape(w.get("transliteration", ""))} - '
+        f'"{escape(w.get("translation", ""))}"</em></p></div></div>'
+        for w in verse.get('words', [])
+    )
+    return (
+        f'<section class="static-ayah" id="ayah-{verse["verse"]}">'
+        f'<h1 class="arabic-verse" lang="ar" dir="rtl">{escape(verse["arabic"])}</h1>'
+        f'<p class="transliteration">{escape(verse.get("transliteration", ""))}</p>'
+        f'<p class="translation">"{escape(verse.get("translation", ""))}"</p>'
+        f'<main class="analysis-grid">\n{words}\n</main></section>'
+    )
+
+
+def render_page(template, surah, verses):
+    first, last = verses[0]['verse'], verses[-1]['verse']
+    title = f'Surah {surah["name"]} ({surah["surah"]}:{first}-{last}) | Quranic Ayah Analysis'
+    body = '\n'.join(render_ayah(v) for v in verses)
+    markup = (
+        f'<div id="root" data-surah="{surah["surah"]}" data-ayah="{first}">'
+        f'<div class="container font-noto-naskh"><header><h3>Surah {escape(surah["name"])}</h3></header>\n'
+        f'{body}\n</div></div>'
+    )
+    page = template.replace('<div id="root"></div>', markup, 1)
+    page = page.replace('<head>', '<head>\n    <base href="/">', 1)
+    page = page.replace('<body>', '<body class="theme-dark">', 1)
+    start = page.index('<title>')
+    end = page.index('</title>', start)
+    return page[:start] + f'<title>{escape(title)}</title>' + page[end + len('</title>'):]
+
+
+def surah_hash(surah, template, page_size):
+    payload = json.dumps([GENERATOR_VERSION, page_size, template, surah], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def build_surah(job):
+    """Render and write every page of one surah; runs in a worker process."""
+    surah, template, out_dir, page_size = job
+    surah_dir = Path(out_dir) / 'surah' / str(surah['surah'])
+    verses = surah['verses']
+    pages = {}
+    if page_size:
+        for i in range(0, len(verses), page_size):
+            block = verses[i:i + page_size]
+            pages[surah_dir / str(i // page_size + 1) / 'index.html'] = render_page(template, surah, block)
+        pages[surah_dir / 'index.html'] = pages[surah_dir / '1' / 'index.html']
+    else:
+        pages[surah_dir / 'index.html'] = render_page(template, surah, verses)
+    # Drop block pages left over from an earlier --page-size
+    if surah_dir.is_dir():
+        for stale in surah_dir.iterdir():
+            if stale.is_dir() and stale.name.isdigit() and stale / 'index.html' not in pages:
+                shutil.rmtree(stale)
+    for path, html in pages.items():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(html, encoding='utf-8')
+    return surah['surah'], len(pages)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pre-render static surah pages from the grammar chunks.')
+    parser.add_argument('--out', default=str(ROOT / 'dist'), help='output directory (default: dist)')
+    parser.add_argument('--template', help='HTML template (default: <out>/index.html, else index.html)')
+    parser.add_argument('--page-size', type=int, default=0, help='also write one page per N ayat')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(), help='worker processes')
+    parser.add_argument('--force', action='store_true', help='regenerate every surah')
+    args = parser.parse_args()
+
+    out_dir = Path(args.out)
+    template_path = Path(args.template) if args.template else out_dir / 'index.html'
+    if not template_path.exists():
+        template_path = ROOT / 'index.html'
+    template = template_path.read_text(encoding='utf-8')
+
+    manifest_path = out_dir / 'surah' / MANIFEST_NAME
+    manifest = {} if args.force or not manifest_path.exists() else json.loads(manifest_path.read_text())
+
+    jobs, hashes = [], {}
+    for number, surah in load_corpus(include_inline=True).items():
+        digest = surah_hash(surah, template, args.page_size)
+        hashes[str(number)] = digest
+        index_page = out_dir / 'surah' / str(number) / 'index.html'
+        if manifest.get(str(number)) == digest and index_page.exists():
+            continue
+        jobs.append((surah, template, str(out_dir), args.page_size))
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        for number, count in pool.map(build_surah, jobs):
+            print(f"Surah {number}: wrote {count} page(s)")
+
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(json.dumps(hashes, indent=2))
+    print(f"Rendered {len(jobs)} surah(s), {len(hashes) - len(jobs)} unchanged (template: {template_path.name})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+/**
+ * Grammar Tag Filtering
+ * Reads the per-word bitmasks written by extract-grammar-tags.py
+ */
+
+export interface TagVocabulary {
+  flags: Record<string, number>;
+  fields: Record<string, { shift: number; values: Record<string, number> }>;
+}
+
+export interface SurahTags {
+  surah: number;
+  verses: number[];
+  masks: number[][];
+}
+
+const TAGS_BASE_URL = '/data/tags';
+
+let vocabularyPromise: Promise<TagVocabulary> | null = null;
+const surahTagsCache = new Map<number, Promise<SurahTags | null>>();
+
+/**
+ * Load the tag vocabulary (flag bits and field shifts), once
+ */
+export function loadTagVocabulary(): Promise<TagVocabulary> {
+  if (!vocabularyPromise) {
+    vocabularyPromise = fetch(`${TAGS_BASE_URL}/vocabulary.json`).then(res => res.json());
+  }
+  return vocabularyPromise;
+}
+
+/**
+ * Load the word masks of one surah; null when the surah has no tags yet
+ */
+export function loadSurahTags(surahNum: number): Promise<SurahTags | null> {
+  if (!surahTagsCache.has(surahNum)) {
+    surahTagsCache.set(
+      surahNum,
+      fetch(`${TAGS_BASE_URL}/${surahNum}.json`)
+        .then(res => (res.ok ? res.json() : null))
+        .catch(() => null)
+    );
+  }
+  return surahTagsCache.get(surahNum)!;
+}
+
+/**
+ * Build a (mask, value) pair: a word matches when (word & mask) === value.
+ * e.g. buildTagQuery(vocab, ['NOUN'], { case: 'GENITIVE' }) for genitive nouns
+ * Throws on flag, field or value names missing from the vocabulary.
+ */
+export function buildTagQuery(
+  vocabulary: TagVocabulary,
+  flags: string[],
+  fields: Record<string, string> = {}
+): { mask: number; value: number } {
+  let mask = 0;
+  let value = 0;
+  for (const flag of flags) {
+    const bit = vocabulary.flags[flag];
+    if (bit === undefined) throw new Error(`Unknown grammar tag: ${flag}`);
+    mask |= bit;
+    value |= bit;
+  }
+  for (const [field, fieldValue] of Object.entries(fields)) {
+    const spec = vocabulary.fields[field];
+    if (!spec) throw new Error(`Unknown grammar field: ${field}`);
+    const index = spec.values[fieldValue];
+    if (index === undefined) throw new Error(`Unknown ${field} value: ${fieldValue}`);
+    mask |= 3 << spec.shift;
+    value |= index << spec.shift;
+  }
+  return { mask: mask >>> 0, value: value >>> 0 };
+}
+
+/**
+ * Indices of the words in one ayah's mask array that match the query
+ */
+export function matchWords(ayahMasks: number[], query: { mask: number; value: number }): number[] {
+  const matches: number[] = [];
+  for (let i = 0; i < ayahMasks.length; i++) {
+    if (((ayahMasks[i] & query.mask) >>> 0) === query.value) {
+      matches.push(i);
+    }
+  }
+  return matches;
+}
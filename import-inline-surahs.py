@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Import the inline initialAllSurahData literal from index.tsx into canonical
+grammar chunks ({surah, name, verses: [{verse, arabic, ..., words: [{..., grammar}]}]}),
+and report malformed strings with their line:column.
+
+Only ayat that no other chunk file has are written, one
+surah-<n>-grammar-inline.json per surah in the repository root, so the
+imported data is picked up by load_corpus() and every data tool like the
+other chunks. Ayat a chunk already has are skipped, and reported when the
+inline copy's text, words or grammar differ, since the chunk's copy wins.
+Re-running is safe: earlier imports are not counted as existing chunks.
+
+Usage: python3 import-inline-surahs.py [--source index.tsx] [--out .] [--check] [--strict]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from js_literal import ParseError
+from quran_data import INDEX_PATH, ROOT, chunk_files, load_chunk, load_inline_surahs
+
+IMPORTED_SUFFIX = '-inline.json'
+AYAH_FIELDS = ('arabic', 'transliteration', 'translation')
+WORD_FIELDS = ('arabic', 'transliteration', 'translation', 'grammar')
+
+
+def existing_ayat(root=ROOT):
+    """
+    {(surah, ayah): (file name, verse)} from chunk files other than earlier
+    imports, keeping the copy load_corpus() would use.
+    """
+    paths = [p for p in chunk_files(root) if not p.name.endswith(IMPORTED_SUFFIX)]
+    chunks = sorted(((p.name, load_chunk(p)) for p in paths), key=lambda item: item[1]['app_format'])
+    verses = {}
+    for name, chunk in chunks:
+        for verse in chunk['verses']:
+            verses.setdefault((chunk['surah'], verse['verse']), (name, verse))
+    return verses
+
+
+def differences(inline, chunk):
+    """Names of the parts of an inline verse that differ from the chunk's copy."""
+    diff = [field for field in AYAH_FIELDS if inline.get(field) != chunk.get(field)]
+    if len(inline['words']) != len(chunk['words']):
+        diff.append(f"word count ({len(inline['words'])} vs {len(chunk['words'])})")
+        return diff
+    for field in WORD_FIELDS:
+        words = [i for i, (a, b) in enumerate(zip(inline['words'], chunk['words']), 1)
+                 if a.get(field) != b.get(field)]
+        if words:
+            diff.append(f"word {field} ({', '.join(map(str, words))})")
+    return diff
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import inline surah data from index.tsx into grammar chunks.')
+    parser.add_argument('--source', default=str(INDEX_PATH), help='file declaring initialAllSurahData')
+    parser.add_argument('--out', default=str(ROOT), help='output directory (default: repository root)')
+    parser.add_argument('--check', action='store_true', help='only parse and report, do not write chunks')
+    parser.add_argument('--strict', action='store_true', help='exit non-zero when any string is malformed or any ayah differs from its chunk')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        chunks, issues = load_inline_surahs(args.source)
+    except ParseError as error:
+        print(f"{args.source}:{error}", file=sys.stderr)
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+
+    for issue in issues:
+        print(f"{args.source}:{issue}", file=sys.stderr)
+
+    existing = existing_ayat()
+    written = 0
+    conflicts = 0
+    for chunk in chunks:
+        verses = []
+        for verse in chunk['verses']:
+            key = (chunk['surah'], verse['verse'])
+            if key not in existing:
+                verses.append(verse)
+                continue
+            name, other = existing[key]
+            diff = differences(verse, other)
+            if diff:
+                conflicts += 1
+                print(f"{args.source}: {key[0]}:{key[1]} differs from {name} in {'; '.join(diff)}", file=sys.stderr)
+        if not verses or args.check:
+            continue
+        out_dir = Path(args.out)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        data = {'surah': chunk['surah'], 'name': chunk['name'], 'verses': verses}
+        path = out_dir / f"surah-{chunk['surah']}-grammar{IMPORTED_SUFFIX}"
+        path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + '\n', encoding='utf-8')
+        written += len(verses)
+
+    ayat = sum(len(c['verses']) for c in chunks)
+    print(f"Parsed {len(chunks)} surah(s), {ayat} ayat in {elapsed * 1000:.0f} ms; "
+          f"{len(issues)} malformed string(s); {conflicts} ayat differ from other chunks; "
+          f"wrote {written} ayat not in other chunks")
+    if args.strict and (issues or conflicts):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
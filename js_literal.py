@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tokenizer and parser for the JavaScript object-literal subset used by the
+inline surah data in index.tsx: objects with quoted or unquoted keys, arrays,
+single/double-quoted strings with backslash and \\u escapes, numbers,
+true/false/null, trailing commas and // or /* */ comments.
+
+Malformed strings do not stop parsing; each problem is recorded as an Issue
+with its line and column so the source can be fixed:
+  - a quote followed by text that cannot end a string (an unescaped
+    apostrophe, as printed by the old convert-surah2-format.py) is kept as
+    part of the string
+  - a raw newline inside a string is kept as part of it
+  - an unnecessary escape such as \\q resolves to the character, as in
+    JavaScript; a malformed \\u or \\x escape keeps the letter
+"""
+
+import re
+from dataclasses import dataclass
+
+TOKEN = re.compile(r'''
+    (?P<ws>(?:\s+|//[^\n]*|/\*.*?\*/)+)
+  | (?P<punct>[{}\[\]:,])
+  | (?P<number>-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<name>[A-Za-z_$][\w$]*)
+  | (?P<quote>['"])
+''', re.X | re.S)
+
+# Everything up to the next quote, backslash or newline
+STRING_RUN = {q: re.compile(r'[^%s\\\n]*' % q) for q in '\'"'}
+SIMPLE_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+# Escapes that only stand for the character itself
+IDENTITY_ESCAPES = set('\'"\\/')
+HEX_ESCAPE = re.compile(r'u([0-9a-fA-F]{4})|u\{([0-9a-fA-F]{1,6})\}|x([0-9a-fA-F]{2})')
+# What may follow a closing quote, by the string's role: a key must be followed
+# by ':', and a comma only ends a value if what follows it can start the next
+# key (in an object) or value (in an array)
+_KEY = r'''(?:[A-Za-z_$][\w$]*|\d+|'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*")\s*:'''
+_VALUE = r'''(?:[\[{'"\d.-]|true\b|false\b|null\b)'''
+STRING_END = {
+    'key': re.compile(r'\s*:'),
+    'object': re.compile(r'\s*(?:}|//|/\*|$|,\s*(?:}|%s))' % _KEY),
+    'array': re.compile(r'\s*(?:]|//|/\*|$|,\s*(?:]|%s))' % _VALUE),
+    None: re.compile(r'\s*(?:[,:}\]]|//|/\*|$)'),
+}
+KEYWORDS = {'true': True, 'false': False, 'null': None}
+
+
+@dataclass
+class Issue:
+    line: int
+    column: int
+    message: str
+
+    def __str__(self):
+        return f'{self.line}:{self.column}: {self.message}'
+
+
+class ParseError(Exception):
+    def __init__(self, issue):
+        super().__init__(str(issue))
+        self.issue = issue
+
+
+class Parser:
+    def __init__(self, text, offset=0, line_base=1):
+        self.text = text
+        self.pos = offset
+        self.line_base = line_base
+        self.issues = []
+        self.containers = []
+        self.reading_key = False
+        self._line_starts = None
+
+    def location(self, pos):
+        if self._line_starts is None:
+            self._line_starts = [0] + [m.end() for m in re.finditer('\n', self.text)]
+        lo, hi = 0, len(self._line_starts) - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self._line_starts[mid] <= pos:
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo + self.line_base, pos - self._line_starts[lo] + 1
+
+    def issue(self, pos, message):
+        self.issues.append(Issue(*self.location(pos), message))
+
+    def error(self, pos, message):
+        return ParseError(Issue(*self.location(pos), message))
+
+    def next_token(self):
+        """Return (kind, value, start) for the next token, skipping whitespace and comments."""
+        text = self.text
+        while True:
+            start = self.pos
+            if start >= len(text):
+                return 'eof', None, start
+            m = TOKEN.match(text, start)
+            if not m:
+                raise self.error(start, f'unexpected character {text[start]!r}')
+            kind = m.lastgroup
+            self.pos = m.end()
+            if kind == 'ws':
+                continue
+            if kind == 'quote':
+                return 'string', self.read_string(m.group(), start), start
+            if kind == 'number':
+                value = m.group()
+                return 'number', float(value) if any(c in value for c in '.eE') else int(value), start
+            return kind, m.group(), start
+
+    def read_string(self, quote, start):
+        text, run = self.text, STRING_RUN[quote]
+        role = 'key' if self.reading_key else (self.containers[-1] if self.containers else None)
+        string_end = STRING_END[role]
+        parts = []
+        pos = self.pos
+        while True:
+            m = run.match(text, pos)
+            parts.append(m.group())
+            pos = m.end()
+            if pos >= len(text):
+                self.issue(start, 'unterminated string at end of input')
+                break
+            char = text[pos]
+            if char == quote:
+                if string_end.match(text, pos + 1):
+                    pos += 1
+                    break
+                self.issue(pos, f'unescaped {quote} inside string')
+                parts.append(quote)
+                pos += 1
+            elif char == '\n':
+                self.issue(pos, 'raw newline inside string')
+                parts.append(char)
+                pos += 1
+            else:
+                pos = self.read_escape(pos, parts)
+        self.pos = pos
+        return ''.join(parts)
+
+    def read_escape(self, pos, parts):
+        text = self.text
+        if pos + 1 >= len(text):
+            self.issue(pos, 'truncated escape at end of input')
+            return pos + 1
+        char = text[pos + 1]
+        if char in 'ux':
+            m = HEX_ESCAPE.match(text, pos + 1)
+            if not m:
+                self.issue(pos, f'malformed \\{char} escape')
+                parts.append(char)
+                return pos + 2
+            parts.append(chr(int(next(g for g in m.groups() if g), 16)))
+            return m.end()
+        if char == '\n':
+            return pos + 2  # line continuation
+        if char not in SIMPLE_ESCAPES and char not in IDENTITY_ESCAPES:
+            self.issue(pos, f'unnecessary escape \\{char}')
+        parts.append(SIMPLE_ESCAPES.get(char, char))
+        return pos + 2
+
+    def parse_value(self, token=None):
+        kind, value, start = token or self.next_token()
+        if kind == 'punct' and value in '{[':
+            self.containers.append('object' if value == '{' else 'array')
+            result = self.parse_object() if value == '{' else self.parse_array()
+            self.containers.pop()
+            return result
+        if kind in ('string', 'number'):
+            return value
+        if kind == 'name' and value in KEYWORDS:
+            return KEYWORDS[value]
+        raise self.error(start, f'unexpected {value!r}' if value is not None else 'unexpected end of input')
+
+    def parse_object(self):
+        result = {}
+        while True:
+            self.reading_key = True
+            kind, key, start = self.next_token()
+            self.reading_key = False
+            if kind == 'punct' and key == '}':
+                return result
+            if kind not in ('name', 'string', 'number'):
+                raise self.error(start, f'expected a key, got {key!r}')
+            kind, value, colon = self.next_token()
+            if value != ':':
+                raise self.error(colon, f"expected ':' after key {key!r}")
+            result[str(key)] = self.parse_value()
+            kind, value, start = self.next_token()
+            if value == '}':
+                return result
+            if value != ',':
+                raise self.error(start, f"expected ',' or '}}', got {value!r}")
+
+    def parse_array(self):
+        result = []
+        while True:
+            token = self.next_token()
+            if token[1] == ']':
+                return result
+            result.append(self.parse_value(token))
+            kind, value, start = self.next_token()
+            if value == ']':
+                return result
+            if value != ',':
+                raise self.error(start, f"expected ',' or ']', got {value!r}")
+
+
+def parse(text, offset=0, line_base=1):
+    """Parse one literal starting at text[offset]; return (value, end offset, issues)."""
+    parser = Parser(text, offset, line_base)
+    value = parser.parse_value()
+    return value, parser.pos, parser.issues
+
+
+def find_declaration(source, name):
+    """Offset of the literal assigned to `const <name> =` in source."""
+    m = re.search(r'\bconst\s+%s\s*(?::[^=]+)?=\s*' % re.escape(name), source)
+    if not m:
+        raise ValueError(f'no declaration of {name}')
+    return m.end()
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Payload size attribution for the shipped corpus.
+
+Attributes raw and compressed (raw DEFLATE, level 9) bytes to
+source -> surah -> ayah -> word -> field for:
+  - the inline initialAllSurahData literal in index.tsx (source text)
+  - the grammar chunk files (compact JSON, as they would ship)
+  - emitted data files under public/data (tiers, tags, similar verses,
+    timings), mapped back to their surah and serialized per field like the
+    chunks; files not tied to one surah go under '(shared)'
+
+Writes a JSON tree and a self-contained HTML treemap with a sortable table,
+and checks optional per-surah budgets (non-zero exit when one is exceeded).
+
+Usage: python3 payload-report.py [--json payload-report.json] [--html payload-report.html]
+                                 [--budgets payload-budgets.json]
+"""
+
+import argparse
+import json
+import re
+import sys
+import zlib
+from collections import defaultdict
+from pathlib import Path
+
+import js_literal
+from quran_data import ROOT, load_corpus, load_json
+
+INLINE_TOKEN = re.compile(
+    r"^    (?P<surah>\d+): \{"
+    r"|ayahNumber:\s*(?P<ayah>\d+)"
+    r"|\b(?P<block>words|analysis):\s*[\[{]"
+    r"|\b(?P<key>\w+):\s*(?P<value>'(?:[^'\\\n]|\\.)*'|\"(?:[^\"\\\n]|\\.)*\")",
+    re.M,
+)
+
+
+def deflated_size(data):
+    if not data:
+        return 0
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+    return len(compressor.compress(data) + compressor.flush())
+
+
+class Node:
+    """A report tree node; leaves hold bytes, parents sum raw and re-compress their leaves."""
+
+    def __init__(self, name, data=b''):
+        self.name = name
+        self.data = data
+        self.children = {}
+
+    def child(self, name):
+        if name not in self.children:
+            self.children[name] = Node(name)
+        return self.children[name]
+
+    def add(self, name, data):
+        leaf = self.child(name)
+        leaf.data += data
+        return leaf
+
+    def payload(self):
+        return self.data + b''.join(c.payload() for c in self.children.values())
+
+    def to_dict(self):
+        payload = self.payload()
+        node = {'name': self.name, 'raw': len(payload), 'gzip': deflated_size(payload)}
+        if self.children:
+            node['children'] = sorted(
+                (c.to_dict() for c in self.children.values()), key=lambda c: c['raw'], reverse=True
+            )
+        return node
+
+
+def inline_tree(path=ROOT / 'index.tsx'):
+    """Attribute the initialAllSurahData source text; syntax between values goes to '(syntax)'."""
+    src = path.read_text(encoding='utf-8')
+    start = src.index('const initialAllSurahData')
+    _, end, _ = js_literal.parse(src, js_literal.find_declaration(src, 'initialAllSurahData'))
+    body = src[start:end]
+
+    root = Node('index.tsx (inline)')
+    fields = defaultdict(bytes)
+    surah = ayah = word = None
+    word_count = 0
+    in_words = in_analysis = False
+    last = 0
+    for m in INLINE_TOKEN.finditer(body):
+        target = word or ayah or surah or root
+        target.add('(syntax)', body[last:m.start()].encode('utf-8'))
+        last = m.end()
+        text = m.group(0).encode('utf-8')
+        if m.group('surah'):
+            surah, ayah, word = root.child(f"surah {m.group('surah')}"), None, None
+            in_words = in_analysis = False
+            surah.add('(syntax)', text)
+        elif m.group('ayah'):
+            ayah, word = (surah or root).child(f"ayah {m.group('ayah')}"), None
+            word_count, in_words, in_analysis = 0, False, False
+            ayah.add('ayahNumber', text)
+        elif m.group('block'):
+            in_words = in_words or m.group('block') == 'words'
+            in_analysis = m.group('block') == 'analysis'
+            target.add('(syntax)', text)
+        else:
+            key = m.group('key')
+            if in_words and key == 'arabic' and ayah is not None:
+                word_count += 1
+                word, in_analysis = ayah.child(f'word {word_count}'), False
+            field = f'analysis.{key}' if in_analysis else key
+            (word or ayah or surah or root).add(field, text)
+            fields[field] += text
+    (surah or root).add('(syntax)', body[last:].encode('utf-8'))
+    return root, fields
+
+
+def compact(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def chunk_tree():
+    """Attribute the merged grammar chunks, serialized as compact JSON."""
+    root = Node('grammar chunks')
+    fields = defaultdict(bytes)
+    for number, surah in load_corpus().items():
+        surah_node = root.child(f'surah {number}')
+        for verse in surah['verses']:
+            ayah_node = surah_node.child(f"ayah {verse['verse']}")
+            for key, value in verse.items():
+                if key == 'words':
+                    continue
+                data = compact({key: value})
+                ayah_node.add(key, data)
+                fields[key] += data
+            for i, word in enumerate(verse.get('words', []), 1):
+                word_node = ayah_node.child(f'word {i}')
+                for key, value in word.items():
+                    items = value.items() if isinstance(value, dict) else [(None, value)]
+                    for sub, sub_value in items:
+                        field = f'{key}.{sub}' if sub else key
+                        data = compact({sub or key: sub_value})
+                        word_node.add(field, data)
+                        fields[field] += data
+    return root, fields
+
+
+def add_fields(node, value, fields, prefix=''):
+    """Add one leaf per (nested) dict field, serialized as compact JSON."""
+    for key, sub in value.items():
+        field = f'{prefix}{key}'
+        if isinstance(sub, dict):
+            add_fields(node, sub, fields, f'{field}.')
+            continue
+        data = compact({key: sub})
+        node.add(field, data)
+        fields[field] += data
+
+
+def add_word_columns(ayah_node, row, fields):
+    """Split {"start": [...], "end": [...]}-style per-word columns across word nodes."""
+    for key, column in row.items():
+        for i, value in enumerate(column, 1):
+            data = compact(value)
+            ayah_node.child(f'word {i}').add(key, data)
+            fields[key] += data
+
+
+def attribute_emitted(node, kind, data, fields):
+    """Attribute one emitted file's ayat, words and fields under its file node."""
+    ayat = data.get('ayat', {})
+    header = {k: v for k, v in data.items() if k not in ('ayat', 'verses', 'masks')}
+    node.add('(header)', compact(header))
+    if kind == 'tags':
+        for verse, masks in zip(data['verses'], data['masks']):
+            add_word_columns(node.child(f'ayah {verse}'), {'tags': masks}, fields)
+    elif kind == 'core':
+        for ayah in ayat:
+            ayah_node = node.child(f"ayah {ayah['ayahNumber']}")
+            add_fields(ayah_node, {k: v for k, v in ayah.items() if k != 'words'}, fields)
+            for i, word in enumerate(ayah.get('words', []), 1):
+                add_fields(ayah_node.child(f'word {i}'), word, fields)
+    elif kind == 'detail':
+        for number, analyses in ayat.items():
+            ayah_node = node.child(f'ayah {number}')
+            for i, analysis in enumerate(analyses, 1):
+                add_fields(ayah_node.child(f'word {i}'), analysis or {}, fields, 'analysis.')
+    elif kind == 'timings':
+        for number, row in ayat.items():
+            add_word_columns(node.child(f'ayah {number}'), row, fields)
+    else:
+        for number, row in ayat.items():
+            add_fields(node.child(f'ayah {number}'), row, fields)
+
+
+def emitted_kind(parts):
+    """(surah number, kind) for an emitted file's path parts, or (None, None) if it is shared."""
+    if parts[0] == 'surahs' and len(parts) == 3 and parts[1].isdigit():
+        return int(parts[1]), 'core' if parts[2] == 'core.json' else 'detail'
+    if parts[-1].split('.')[0].isdigit() and parts[0] in ('tags', 'similar', 'timings'):
+        return int(parts[-1].split('.')[0]), parts[0]
+    return None, None
+
+
+def emitted_tree(data_dir=ROOT / 'public' / 'data'):
+    """Attribute public/data per surah -> file -> ayah -> word -> field."""
+    root = Node('public/data')
+    fields = defaultdict(bytes)
+    for path in sorted(Path(data_dir).rglob('*.json')):
+        rel = path.relative_to(data_dir)
+        number, kind = emitted_kind(rel.parts)
+        if number is None:
+            root.child('(shared)').add(rel.as_posix(), path.read_bytes())
+            continue
+        attribute_emitted(root.child(f'surah {number}').child(rel.as_posix()), kind, load_json(path), fields)
+    return root, fields
+
+
+def field_summary(fields):
+    return sorted(
+        ({'field': name, 'raw': len(data), 'gzip': deflated_size(data)} for name, data in fields.items()),
+        key=lambda f: f['raw'], reverse=True,
+    )
+
+
+def check_budgets(tree, budgets):
+    """Return a list of messages for surahs over their raw/gzip budget ('*' is the default)."""
+    failures = []
+    for source in tree.get('children', []):
+        for surah in source.get('children', []):
+            if not surah['name'].startswith('surah '):
+                continue
+            number = surah['name'].split()[1]
+            budget = budgets.get(number, budgets.get('*'))
+            if not budget:
+                continue
+            for metric in ('raw', 'gzip'):
+                if metric in budget and surah[metric] > budget[metric]:
+                    failures.append(f"{source['name']} / {surah['name']}: {metric} "
+                                    f"{surah[metric]:,} B > budget {budget[metric]:,} B")
+    return failures
+
+
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="en"><head><meta charset="UTF-8"><title>Payload report</title>
+<style>
+body { font-family: sans-serif; margin: 1rem; }
+#map { position: relative; width: 100%; height: 60vh; border: 1px solid #999; }
+.cell { position: absolute; box-sizing: border-box; border: 1px solid #fff; overflow: hidden;
+        font-size: 11px; color: #fff; padding: 2px; cursor: pointer; }
+table { border-collapse: collapse; margin-top: 1rem; }
+th, td { padding: 2px 8px; text-align: right; } th { cursor: pointer; } td:first-child { text-align: left; }
+</style></head><body>
+<h1>Payload report</h1>
+<p id="path"></p><div id="map"></div>
+<table><thead><tr><th data-k="name">Name</th><th data-k="raw">Raw bytes</th><th data-k="gzip">Compressed</th></tr></thead>
+<tbody id="rows"></tbody></table>
+<h2>By field</h2>
+<table><thead><tr><th>Field</th><th>Raw bytes</th><th>Compressed</th></tr></thead><tbody id="fields"></tbody></table>
+<script>
+const REPORT = __REPORT__;
+let stack = [REPORT.tree], sortKey = 'raw';
+const colors = ['#2563eb', '#059669', '#d97706', '#dc2626', '#7c3aed', '#0891b2', '#65a30d', '#db2777'];
+function layout(items, x, y, w, h, out) {
+  // Slice-and-dice, alternating direction by the longer side
+  const total = items.reduce((s, n) => s + n.raw, 0) || 1;
+  let offset = 0;
+  items.forEach((n, i) => {
+    const share = n.raw / total;
+    const rect = w >= h ? [x + offset * w, y, share * w, h] : [x, y + offset * h, w, share * h];
+    offset += share;
+    out.push([n, rect, colors[i % colors.length]]);
+  });
+  return out;
+}
+function render() {
+  const node = stack[stack.length - 1];
+  const children = node.children || [];
+  document.getElementById('path').textContent = stack.map(n => n.name).join(' / ') + (stack.length > 1 ? '  (click to zoom, Esc to go up)' : '  (click to zoom)');
+  const map = document.getElementById('map');
+  map.innerHTML = '';
+  for (const [n, [x, y, w, h], color] of layout(children, 0, 0, 100, 100, [])) {
+    const cell = document.createElement('div');
+    cell.className = 'cell';
+    Object.assign(cell.style, { left: x + '%', top: y + '%', width: w + '%', height: h + '%', background: color });
+    cell.textContent = `${n.name} ${n.raw.toLocaleString()} B`;
+    cell.title = `${n.name}: ${n.raw.toLocaleString()} B raw, ${n.gzip.toLocaleString()} B compressed`;
+    if (n.children) cell.onclick = () => { stack.push(n); render(); };
+    map.appendChild(cell);
+  }
+  const rows = [...children].sort((a, b) => sortKey === 'name' ? a.name.localeCompare(b.name) : b[sortKey] - a[sortKey]);
+  document.getElementById('rows').innerHTML = rows.map(n => `<tr><td>${n.name}</td><td>${n.raw.toLocaleString()}</td><td>${n.gzip.toLocaleString()}</td></tr>`).join('');
+}
+document.querySelectorAll('th[data-k]').forEach(th => th.onclick = () => { sortKey = th.dataset.k; render(); });
+document.addEventListener('keydown', e => { if (e.key === 'Escape' && stack.length > 1) { stack.pop(); render(); } });
+document.getElementById('fields').innerHTML = REPORT.fields.map(f => `<tr><td>${f.source}: ${f.field}</td><td>${f.raw.toLocaleString()}</td><td>${f.gzip.toLocaleString()}</td></tr>`).join('');
+render();
+</script></body></html>
+"""
+
+
+def build_report():
+    inline, inline_fields = inline_tree()
+    chunks, chunk_fields = chunk_tree()
+    emitted, emitted_fields = emitted_tree()
+    root = Node('corpus')
+    root.children = {n.name: n for n in (inline, chunks, emitted)}
+    fields = [dict(f, source=inline.name) for f in field_summary(inline_fields)]
+    fields += [dict(f, source=chunks.name) for f in field_summary(chunk_fields)]
+    fields += [dict(f, source=emitted.name) for f in field_summary(emitted_fields)]
+    return {'tree': root.to_dict(), 'fields': fields}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Attribute payload bytes to surah/ayah/word/field.')
+    parser.add_argument('--json', default='payload-report.json', help='JSON report path')
+    parser.add_argument('--html', default='payload-report.html', help='HTML treemap path')
+    parser.add_argument('--budgets', help='per-surah budgets: {"<surah>" or "*": {"raw": N, "gzip": N}}')
+    args = parser.parse_args()
+
+    report = build_report()
+    Path(args.json).write_text(json.dumps(report, ensure_ascii=False, indent=1), encoding='utf-8')
+    Path(args.html).write_text(
+        HTML_TEMPLATE.replace('__REPORT__', json.dumps(report, ensure_ascii=False).replace('</', '<\\/')),
+        encoding='utf-8',
+    )
+
+    for source in report['tree']['children']:
+        print(f"{source['name']:<24}{source['raw']:>12,} B raw{source['gzip']:>10,} B compressed")
+    print('\nLargest fields:')
+    for field in sorted(report['fields'], key=lambda f: f['raw'], reverse=True)[:10]:
+        print(f"  {field['source']:<22}{field['field']:<26}{field['raw']:>10,}{field['gzip']:>10,}")
+    print(f"\nWrote {args.json} and {args.html}")
+
+    if args.budgets:
+        failures = check_budgets(report['tree'], json.loads(Path(args.budgets).read_text()))
+        for failure in failures:
+            print(f"OVER BUDGET: {failure}")
+        if failures:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
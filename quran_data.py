@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared helpers for the data scripts: loading the grammar chunk files into one
+corpus and building recitation URLs from the reciter table (reciters.json).
+"""
+
+import json
+import re
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+RECITERS_PATH = ROOT / 'reciters.json'
+INDEX_PATH = ROOT / 'index.tsx'
+
+# Ayah count of each surah, 1-114 (sums to 6236)
+SURAH_AYAH_COUNTS = (
+    7, 286, 200, 176, 120, 165, 206, 75, 129, 109, 123, 111, 43, 52, 99, 128, 111, 110, 98,
+    135, 112, 78, 118, 64, 77, 227, 93, 88, 69, 60, 34, 30, 73, 54, 45, 83, 182, 88,
+    75, 85, 54, 53, 89, 59, 37, 35, 38, 29, 18, 45, 60, 49, 62, 55, 78, 96, 29,
+    22, 24, 13, 14, 11, 11, 18, 12, 12, 30, 52, 52, 44, 28, 28, 20, 56, 40, 31,
+    50, 40, 46, 42, 29, 19, 36, 25, 22, 17, 19, 26, 30, 20, 15, 21, 11, 8, 8,
+    19, 5, 8, 8, 11, 11, 8, 3, 9, 5, 4, 7, 3, 6, 3, 5, 4, 5, 6,
+)
+TOTAL_AYAT = sum(SURAH_AYAH_COUNTS)
+
+CHUNK_PATTERNS = ('surah-*-grammar*.json', 'surah-*-verses-*.json')
+SURAH_FROM_NAME = re.compile(r'surah-0*(\d+)-')
+
+# Chunk 'grammar' keys <-> app 'analysis' keys (same mapping as convert-surah2-format.py)
+APP_FIELD_NAMES = {'reason': 'rootExplanation', 'practical': 'grammar'}
+CHUNK_FIELD_NAMES = {v: k for k, v in APP_FIELD_NAMES.items()}
+
+
+def all_ayat():
+    """Every (surah, ayah) pair of the full Quran, in order."""
+    return [(s, a) for s, n in enumerate(SURAH_AYAH_COUNTS, 1) for a in range(1, n + 1)]
+
+
+def load_json(path):
+    """Load a JSON file, tolerating raw control characters inside strings."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.loads(f.read(), strict=False)
+
+
+def load_reciters(path=RECITERS_PATH):
+    return load_json(path)
+
+
+def recitation_url(surah, ayah, reciter_id=None, reciters=None):
+    """Build the audio URL for (surah, ayah) from a reciter's URL template."""
+    reciters = reciters or load_reciters()
+    reciter_id = reciter_id or reciters['default']
+    if reciter_id not in reciters['reciters']:
+        raise ValueError(f"Unknown reciter '{reciter_id}'")
+    template = reciters['reciters'][reciter_id]['urlTemplate']
+    return template.format(surah=f'{surah:03d}', ayah=f'{ayah:03d}')
+
+
+def chunk_word_to_app(word):
+    """Convert a chunk word ({grammar: {...}}) to the app's {analysis: {...}} shape."""
+    grammar = word.get('grammar', {})
+    analysis = {
+        'type': grammar.get('type', ''),
+        'root': grammar.get('root', 'N/A'),
+        'rootExplanation': grammar.get('reason', ''),
+        'grammar': grammar.get('practical', '') or grammar.get('reason', ''),
+    }
+    for key, value in grammar.items():
+        if key not in APP_FIELD_NAMES and key not in analysis:
+            analysis[key] = value
+    return {
+        'arabic': word['arabic'],
+        'transliteration': word.get('transliteration', ''),
+        'translation': word.get('translation', ''),
+        'analysis': analysis,
+    }
+
+
+def app_word_to_chunk(word):
+    """Convert an app word ({analysis: {...}}) back to the chunk {grammar: {...}} shape."""
+    grammar = {}
+    for key, value in word.get('analysis', {}).items():
+        if value in ('', None):
+            continue
+        grammar[CHUNK_FIELD_NAMES.get(key, key)] = value
+    return {
+        'arabic': word['arabic'],
+        'transliteration': word.get('transliteration', ''),
+        'translation': word.get('translation', ''),
+        'grammar': grammar,
+    }
+
+
+def _normalize_verse(verse):
+    if 'verse' in verse:
+        return verse
+    return {
+        'verse': verse['ayahNumber'],
+        'arabic': verse['arabic'],
+        'transliteration': verse.get('transliteration', ''),
+        'translation': verse.get('translation', ''),
+        'words': [app_word_to_chunk(w) for w in verse.get('words', [])],
+    }
+
+
+def chunk_files(root=ROOT):
+    """All grammar chunk files, excluding backups, in a stable order."""
+    files = set()
+    for pattern in CHUNK_PATTERNS:
+        files.update(p for p in Path(root).glob(pattern) if '.backup' not in p.name)
+    return sorted(files)
+
+
+def load_chunk(path):
+    """
+    Load one chunk file as {'surah', 'name', 'verses'} whatever its layout:
+    a bare list of verses, {surah, name, verses} or the app-style {surahNumber, ayat}.
+    """
+    path = Path(path)
+    data = load_json(path)
+    match = SURAH_FROM_NAME.match(path.name)
+    surah = int(match.group(1)) if match else None
+    name = ''
+    if isinstance(data, dict):
+        surah = data.get('surah', data.get('surahNumber', surah))
+        name = data.get('name', data.get('surahName', ''))
+        verses = data.get('verses', data.get('ayat', []))
+    else:
+        verses = data
+    return {
+        'surah': surah,
+        'name': name,
+        'app_format': isinstance(data, dict) and 'ayat' in data,
+        'verses': [_normalize_verse(v) for v in verses],
+    }
+
+
+def load_inline_surahs(path=INDEX_PATH):
+    """
+    Parse the inline initialAllSurahData literal of index.tsx into chunks.
+    Returns (chunks, issues); issues are js_literal.Issue for malformed strings.
+    """
+    import js_literal
+
+    source = Path(path).read_text(encoding='utf-8')
+    start = js_literal.find_declaration(source, 'initialAllSurahData')
+    data, _, issues = js_literal.parse(source, start)
+    chunks = []
+    for key, surah in data.items():
+        chunks.append({
+            'surah': surah.get('surahNumber', int(key)),
+            'name': surah.get('surahName', ''),
+            'app_format': True,
+            'verses': [_normalize_verse(v) for v in surah.get('ayat', [])],
+        })
+    return chunks, issues
+
+
+def load_corpus(root=ROOT, include_inline=False):
+    """
+    Merge every chunk file into {surah_number: {'surah', 'name', 'verses'}}.
+    Grammar-format chunks win over app-format ones, which win over the inline
+    index.tsx data (only read with include_inline); otherwise the first file
+    (by name) that has a verse keeps it.
+    """
+    chunks = [load_chunk(p) for p in chunk_files(root)]
+    chunks.sort(key=lambda c: c['app_format'])
+    if include_inline:
+        chunks += load_inline_surahs(Path(root) / INDEX_PATH.name)[0]
+    corpus = {}
+    for chunk in chunks:
+        surah = corpus.setdefault(chunk['surah'], {'surah': chunk['surah'], 'name': '', 'verses': {}})
+        surah['name'] = surah['name'] or chunk['name']
+        for verse in chunk['verses']:
+            surah['verses'].setdefault(verse['verse'], verse)
+    for surah in corpus.values():
+        surah['verses'] = [surah['verses'][n] for n in sorted(surah['verses'])]
+    return dict(sorted(corpus.items()))
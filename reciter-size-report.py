@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Size report for templated recitation URLs.
+
+Compares storing a full `recitationUrl` on every ayah against deriving it
+from reciters.json at load time, for the inline data in index.tsx, the
+grammar chunk corpus and a full-Quran projection.
+
+Usage: python3 reciter-size-report.py [--reciter ID] [--json]
+"""
+
+import argparse
+import gzip
+import json
+import re
+
+import js_literal
+from quran_data import ROOT, RECITERS_PATH, all_ayat, load_corpus, load_reciters, recitation_url
+
+INLINE_SURAH = re.compile(r'^    (\d+): \{', re.M)
+INLINE_AYAH = re.compile(r'ayahNumber: (\d+)')
+
+
+def inline_ayat(path=ROOT / 'index.tsx'):
+    """(surah, ayah) pairs of the inline initialAllSurahData literal."""
+    src = path.read_text(encoding='utf-8')
+    start = src.index('const initialAllSurahData')
+    _, end, _ = js_literal.parse(src, js_literal.find_declaration(src, 'initialAllSurahData'))
+    body = src[start:end]
+    pairs = []
+    bounds = [(m.start(), int(m.group(1))) for m in INLINE_SURAH.finditer(body)]
+    for i, (pos, surah) in enumerate(bounds):
+        stop = bounds[i + 1][0] if i + 1 < len(bounds) else len(body)
+        pairs.extend((surah, int(a)) for a in INLINE_AYAH.findall(body, pos, stop))
+    return pairs
+
+
+def field_cost(pairs, reciter_id, reciters, template):
+    fields = ''.join(template.format(recitation_url(s, a, reciter_id, reciters)) for s, a in pairs)
+    raw = fields.encode('utf-8')
+    return {'ayat': len(pairs), 'raw': len(raw), 'gzip': len(gzip.compress(raw)) if raw else 0}
+
+
+def build_report(reciter_id=None):
+    reciters = load_reciters()
+    reciter_id = reciter_id or reciters['default']
+    table = RECITERS_PATH.read_bytes()
+
+    inline = inline_ayat()
+    corpus = [(s['surah'], v['verse']) for s in load_corpus().values() for v in s['verses']]
+
+    sources = {
+        'index.tsx (inline)': field_cost(inline, reciter_id, reciters, "recitationUrl: '{}', "),
+        'grammar chunks (JSON)': field_cost(corpus, reciter_id, reciters, '"recitationUrl": "{}", '),
+        'full Quran (JSON)': field_cost(all_ayat(), reciter_id, reciters, '"recitationUrl": "{}", '),
+    }
+    # A source with no ayat (the inline literal once its surahs moved to chunks) has nothing to save
+    sources = {name: cost for name, cost in sources.items() if cost['ayat']}
+    return {
+        'reciter': reciter_id,
+        'reciterTable': {'raw': len(table), 'gzip': len(gzip.compress(table)),
+                         'reciters': len(reciters['reciters'])},
+        'sources': sources,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--reciter', choices=sorted(load_reciters()['reciters']),
+                        help='reciter id from reciters.json (default: table default)')
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    args = parser.parse_args()
+
+    report = build_report(args.reciter)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    table = report['reciterTable']
+    print(f"Reciter: {report['reciter']}  |  reciters.json: {table['raw']:,} B raw, "
+          f"{table['gzip']:,} B gzip, {table['reciters']} reciters")
+    print(f"{'Source':<24}{'Ayat':>7}{'URL bytes':>12}{'gzip':>9}{'Saved (raw)':>13}")
+    for name, cost in report['sources'].items():
+        saved = cost['raw'] - table['raw']
+        print(f"{name:<24}{cost['ayat']:>7,}{cost['raw']:>12,}{cost['gzip']:>9,}{saved:>13,}")
+    print("URL bytes are per reciter: each extra reciter would have repeated them in full.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Precompute "verses that use the same roots" recommendations.
+
+Builds a sparse ayah x root matrix from the words' `grammar.root` fields,
+weights it with TF-IDF, and computes the top-k cosine neighbours of every
+ayah in blocks of rows (sparse x sparse products, one dense block at a time).
+Writes one compact neighbour table per surah:
+  <out>/<surah>.json  {"surah", "k", "ayat": {"<ayah>": {"ids": [...], "scores": [...]}}}
+where an id is surah * 1000 + ayah.
+
+Requires numpy and scipy.
+
+Usage: python3 similar-verses.py [--out public/data/similar] [-k 10] [--block-size 1024]
+       python3 similar-verses.py --benchmark   (synthetic full-Quran-sized corpus)
+"""
+
+import argparse
+import json
+import re
+import time
+from pathlib import Path
+
+import numpy as np
+from scipy import sparse
+
+from quran_data import ROOT, SURAH_AYAH_COUNTS, load_corpus
+
+ARABIC_LETTERS = re.compile(r'[ء-ي]')
+# Hamza carriers are spelled inconsistently across chunks ("أ-م-ن" vs "ء م ن")
+HAMZA_FORMS = str.maketrans('أإآاؤئ', 'ءءءءءء')
+
+# Synthetic benchmark corpus: about the Quran's word and root counts
+BENCH_ROOTS = 1700
+BENCH_MEAN_WORDS = 12
+
+
+def root_key(root):
+    """Normalize a free-text root ("ع-ل-م ('a-l-m) - to know") to its letters, or None."""
+    if not root or root.upper().startswith('N/A'):
+        return None
+    head = re.split(r'[(\[]| - ', root, maxsplit=1)[0]
+    letters = ''.join(ARABIC_LETTERS.findall(head)).translate(HAMZA_FORMS)
+    return letters if 2 <= len(letters) <= 5 else None
+
+
+def corpus_rows(corpus):
+    """Yield ((surah, ayah), [root keys]) for every ayah of the chunk corpus."""
+    for number, surah in corpus.items():
+        for verse in surah['verses']:
+            roots = [root_key(w.get('grammar', {}).get('root')) for w in verse.get('words', [])]
+            yield (number, verse['verse']), [r for r in roots if r]
+
+
+def build_matrix(rows):
+    """Sparse (ayat x roots) count matrix from (ayah id, [roots]) pairs."""
+    ids, indptr, indices = [], [0], []
+    vocabulary = {}
+    for ayah_id, roots in rows:
+        ids.append(ayah_id)
+        indices.extend(vocabulary.setdefault(r, len(vocabulary)) for r in roots)
+        indptr.append(len(indices))
+    data = np.ones(len(indices), dtype=np.float32)
+    counts = sparse.csr_matrix((data, indices, indptr), shape=(len(ids), len(vocabulary)))
+    counts.sum_duplicates()
+    return ids, counts
+
+
+def tfidf(counts):
+    """Sublinear TF x smoothed IDF, rows L2-normalized."""
+    n = counts.shape[0]
+    df = np.bincount(counts.indices, minlength=counts.shape[1])
+    idf = np.log((1 + n) / (1 + df)).astype(np.float32) + 1
+    weighted = counts.copy()
+    weighted.data = (1 + np.log(weighted.data)) * idf[weighted.indices]
+    norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return sparse.diags(1 / norms).astype(np.float32) @ weighted
+
+
+def top_k_neighbors(vectors, k, block_size=1024):
+    """Top-k cosine neighbours (excluding self) of every row, computed block by block."""
+    n = vectors.shape[0]
+    k = min(k, n - 1)
+    transposed = vectors.T.tocsc()
+    neighbor_ids = np.zeros((n, k), dtype=np.int32)
+    neighbor_scores = np.zeros((n, k), dtype=np.float32)
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        scores = (vectors[start:stop] @ transposed).toarray()
+        scores[np.arange(stop - start), np.arange(start, stop)] = 0
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        neighbor_ids[start:stop] = np.take_along_axis(top, order, axis=1)
+        neighbor_scores[start:stop] = np.take_along_axis(top_scores, order, axis=1)
+    return neighbor_ids, neighbor_scores
+
+
+def compute(rows, k, block_size):
+    ids, counts = build_matrix(rows)
+    return ids, counts, top_k_neighbors(tfidf(counts), k, block_size)
+
+
+def write_tables(out_dir, ids, neighbor_ids, neighbor_scores, k):
+    out_dir.mkdir(parents=True, exist_ok=True)
+    packed = np.array([s * 1000 + a for s, a in ids], dtype=np.int32)
+    tables = {}
+    for row, (surah, ayah) in enumerate(ids):
+        keep = neighbor_scores[row] > 0
+        tables.setdefault(surah, {})[str(ayah)] = {
+            'ids': packed[neighbor_ids[row][keep]].tolist(),
+            'scores': np.round(neighbor_scores[row][keep].astype(np.float64), 3).tolist(),
+        }
+    for surah, ayat in tables.items():
+        data = {'surah': surah, 'k': k, 'ayat': ayat}
+        (out_dir / f'{surah}.json').write_text(json.dumps(data, separators=(',', ':')))
+    return len(tables)
+
+
+def synthetic_rows(seed=0):
+    """A full-Quran-sized corpus: 6236 ayat, Zipf-distributed roots."""
+    rng = np.random.default_rng(seed)
+    ranks = np.arange(1, BENCH_ROOTS + 1)
+    weights = 1 / ranks
+    weights /= weights.sum()
+    rows = []
+    for surah, count in enumerate(SURAH_AYAH_COUNTS, 1):
+        for ayah in range(1, count + 1):
+            words = max(1, rng.poisson(BENCH_MEAN_WORDS))
+            rows.append(((surah, ayah), rng.choice(BENCH_ROOTS, size=words, p=weights).tolist()))
+    return rows
+
+
+def benchmark(k, block_size):
+    rows = synthetic_rows()
+    timings = {}
+    start = time.perf_counter()
+    ids, counts = build_matrix(rows)
+    timings['matrix'] = time.perf_counter() - start
+    start = time.perf_counter()
+    vectors = tfidf(counts)
+    timings['tf-idf'] = time.perf_counter() - start
+    start = time.perf_counter()
+    top_k_neighbors(vectors, k, block_size)
+    timings['top-k'] = time.perf_counter() - start
+    print(f"Synthetic corpus: {counts.shape[0]:,} ayat x {counts.shape[1]:,} roots, {counts.nnz:,} non-zeros")
+    for phase, seconds in timings.items():
+        print(f"  {phase:<8}{seconds:>8.3f} s")
+    print(f"  {'total':<8}{sum(timings.values()):>8.3f} s  (k={k}, block size {block_size})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompute similar-verse recommendations from shared roots.')
+    parser.add_argument('--out', default=str(ROOT / 'public' / 'data' / 'similar'), help='output directory')
+    parser.add_argument('-k', type=int, default=10, help='neighbours per ayah')
+    parser.add_argument('--block-size', type=int, default=1024, help='rows per similarity block')
+    parser.add_argument('--benchmark', action='store_true', help='time a synthetic full-Quran corpus instead')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.k, args.block_size)
+        return
+
+    start = time.perf_counter()
+    rows = corpus_rows(load_corpus(include_inline=True))
+    ids, counts, (neighbor_ids, neighbor_scores) = compute(rows, args.k, args.block_size)
+    surahs = write_tables(Path(args.out), ids, neighbor_ids, neighbor_scores, args.k)
+    print(f"{counts.shape[0]} ayat x {counts.shape[1]} roots -> {surahs} surah table(s) "
+          f"in {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Split each surah into a small "core" tier and lazily loaded "detail" tiers.
+
+core.json holds what the reading view needs up front: ayah text, translation,
+transliteration and word glosses (audio URLs are derived from reciters.json).
+detail-<from>-<to>.json holds the word analyses (type, root, grammar prose and
+the extra grammar fields) for one block of ayat; core.json lists the blocks
+so the app can fetch the one it needs on demand or prefetch when idle.
+
+Output: <out>/<surah>/core.json and <out>/<surah>/detail-<from>-<to>.json.
+Prints the core-tier size against the full (core + analysis) payload per surah.
+
+Usage: python3 split-data-tiers.py [--out public/data/surahs] [--block-size 10] [--report tiers.json]
+"""
+
+import argparse
+import gzip
+import json
+from pathlib import Path
+
+from quran_data import ROOT, chunk_word_to_app, load_corpus
+
+
+def compact(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def core_ayah(verse):
+    return {
+        'ayahNumber': verse['verse'],
+        'arabic': verse['arabic'],
+        'transliteration': verse.get('transliteration', ''),
+        'translation': verse.get('translation', ''),
+        'words': [
+            {'arabic': w['arabic'], 'transliteration': w.get('transliteration', ''),
+             'translation': w.get('translation', '')}
+            for w in verse.get('words', [])
+        ],
+    }
+
+
+def split_surah(surah, block_size):
+    """Return (core, {file name: detail tier}) for one corpus surah."""
+    verses = surah['verses']
+    tiers = {}
+    refs = []
+    for i in range(0, len(verses), block_size):
+        block = verses[i:i + block_size]
+        first, last = block[0]['verse'], block[-1]['verse']
+        name = f'detail-{first}-{last}.json'
+        tiers[name] = {
+            'surahNumber': surah['surah'],
+            'from': first,
+            'to': last,
+            'ayat': {
+                str(v['verse']): [chunk_word_to_app(w)['analysis'] for w in v.get('words', [])]
+                for v in block
+            },
+        }
+        refs.append({'from': first, 'to': last, 'file': name})
+    core = {
+        'surahNumber': surah['surah'],
+        'surahName': surah['name'],
+        'ayat': [core_ayah(v) for v in verses],
+        'detailTiers': refs,
+    }
+    return core, tiers
+
+
+def full_payload(surah):
+    """The single-file app payload the tiers replace, for the size comparison."""
+    ayat = []
+    for verse in surah['verses']:
+        ayah = core_ayah(verse)
+        ayah['words'] = [chunk_word_to_app(w) for w in verse.get('words', [])]
+        ayat.append(ayah)
+    return {'surahNumber': surah['surah'], 'surahName': surah['name'], 'ayat': ayat}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Split surah data into core and detail tiers.')
+    parser.add_argument('--out', default=str(ROOT / 'public' / 'data' / 'surahs'), help='output directory')
+    parser.add_argument('--block-size', type=int, default=10, help='ayat per detail tier')
+    parser.add_argument('--report', help='also write the size report as JSON')
+    args = parser.parse_args()
+
+    report = {}
+    print(f"{'Surah':>5}{'Ayat':>6}{'Full':>11}{'Core':>10}{'Saved':>8}{'Full gz':>10}{'Core gz':>10}")
+    for number, surah in load_corpus(include_inline=True).items():
+        core, tiers = split_surah(surah, args.block_size)
+        surah_dir = Path(args.out) / str(number)
+        surah_dir.mkdir(parents=True, exist_ok=True)
+        for stale in surah_dir.glob('detail-*.json'):
+            stale.unlink()
+        core_bytes = compact(core)
+        (surah_dir / 'core.json').write_bytes(core_bytes)
+        for name, tier in tiers.items():
+            (surah_dir / name).write_bytes(compact(tier))
+
+        full_bytes = compact(full_payload(surah))
+        sizes = {
+            'ayat': len(surah['verses']),
+            'full': len(full_bytes), 'core': len(core_bytes),
+            'fullGzip': len(gzip.compress(full_bytes)), 'coreGzip': len(gzip.compress(core_bytes)),
+            'detailTiers': len(tiers),
+        }
+        report[number] = sizes
+        saved = 1 - sizes['core'] / sizes['full']
+        print(f"{number:>5}{sizes['ayat']:>6}{sizes['full']:>11,}{sizes['core']:>10,}{saved:>8.0%}"
+              f"{sizes['fullGzip']:>10,}{sizes['coreGzip']:>10,}")
+
+    if args.report:
+        Path(args.report).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
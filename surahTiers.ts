@@ -0,0 +1,105 @@
+/**
+ * Tiered Surah Data
+ * Loads the core/detail tiers written by split-data-tiers.py
+ */
+
+export interface DetailTierRef {
+  from: number;
+  to: number;
+  file: string;
+}
+
+interface DetailTier {
+  surahNumber: number;
+  from: number;
+  to: number;
+  ayat: Record<string, any[]>;
+}
+
+const SURAH_DATA_BASE_URL = '/data/surahs';
+
+const tierCache = new Map<string, Promise<any | null>>();
+
+/**
+ * Fetch a tier file once. A network failure is never cached, so the next call
+ * retries; a missing file is only cached when cacheMissing is set
+ */
+function fetchTier(url: string, cacheMissing = true): Promise<any | null> {
+  if (!tierCache.has(url)) {
+    tierCache.set(url, fetch(url)
+      .then(res => {
+        if (!res.ok && !cacheMissing) tierCache.delete(url);
+        return res.ok ? res.json() : null;
+      })
+      .catch(() => {
+        tierCache.delete(url);
+        return null;
+      }));
+  }
+  return tierCache.get(url)!;
+}
+
+/**
+ * Load a surah's core tier: ayah text and word glosses, no analysis
+ */
+export function loadSurahCore(surahNum: number): Promise<any | null> {
+  return fetchTier(`${SURAH_DATA_BASE_URL}/${surahNum}/core.json`);
+}
+
+/**
+ * Fetch a surah's core tier again, bypassing the cache; detail file names
+ * change when the data is regenerated, so a missing tier means a stale core
+ */
+export function reloadSurahCore(surahNum: number): Promise<any | null> {
+  tierCache.delete(`${SURAH_DATA_BASE_URL}/${surahNum}/core.json`);
+  return loadSurahCore(surahNum);
+}
+
+/**
+ * Load the detail tier covering one ayah; null if the surah has no tiers
+ */
+export function loadDetailTier(surahData: any, ayahNumber: number): Promise<DetailTier | null> {
+  const ref = (surahData.detailTiers as DetailTierRef[] | undefined)?.find(
+    tier => ayahNumber >= tier.from && ayahNumber <= tier.to
+  );
+  if (!ref) return Promise.resolve(null);
+
+  return fetchTier(`${SURAH_DATA_BASE_URL}/${surahData.surahNumber}/${ref.file}`, false);
+}
+
+/**
+ * Whether an ayah's words still need their detail tier
+ */
+export function needsDetail(ayah: any): boolean {
+  return ayah.words.some(word => !word.analysis);
+}
+
+/**
+ * Attach a detail tier's analyses to the words that do not have one yet;
+ * returns surahData itself when there was nothing to attach
+ */
+export function mergeDetailTier(surahData: any, tier: DetailTier): any {
+  let merged = false;
+  const ayat = surahData.ayat.map(ayah => {
+    const analyses = tier.ayat[ayah.ayahNumber];
+    if (!analyses || !ayah.words.some((word, index) => !word.analysis && analyses[index])) return ayah;
+    merged = true;
+    return {
+      ...ayah,
+      words: ayah.words.map((word, index) => word.analysis || !analyses[index] ? word : { ...word, analysis: analyses[index] }),
+    };
+  });
+  return merged ? { ...surahData, ayat } : surahData;
+}
+
+/**
+ * Run a callback when the browser is idle (falls back to a short timeout)
+ */
+export function whenIdle(callback: () => void): () => void {
+  if ('requestIdleCallback' in window) {
+    const handle = window.requestIdleCallback(callback, { timeout: 2000 });
+    return () => window.cancelIdleCallback(handle);
+  }
+  const handle = setTimeout(callback, 200);
+  return () => clearTimeout(handle);
+}
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Extract per-word start/end times from locally stored ayah recitations.
+
+For every ayah with a recitation file (everyayah naming: <audio-dir>/SSSAAA.wav
+or .mp3) the audio is cut into frames, silent stretches are found from the
+frame energy, and exactly len(words) - 1 word boundaries are chosen among
+them by dynamic programming. The cost favours deep, long pauses near where
+the word's share of the ayah's letters says a boundary should be. Where a
+recitation runs words together, an energy dip between them is used with
+lower confidence, and failing that the expected position with none.
+
+Ayat are processed in a process pool; one timing table is written per surah
+and reciter:
+  <out>/<reciter>/<surah>.json  {"surah", "reciter", "ayat": {"<ayah>":
+                                 {"start": [ms], "end": [ms], "confidence": [0-1]}}}
+
+WAV (8/16/24/32-bit PCM) is read with the standard library; MP3 needs the
+optional `audioread` package (and a backend such as ffmpeg). Requires numpy.
+A file that cannot be decoded is reported and skipped.
+
+Usage: python3 word-audio-timings.py --audio-dir recitations/nasser_alqatami [--reciter ID]
+                                     [--out public/data/timings] [--jobs N]
+       python3 word-audio-timings.py --benchmark 200 [--max-error 40]   (synthetic tone-and-silence ayat;
+                                     exits non-zero when a check fails)
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+import wave
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from quran_data import ROOT, load_corpus, load_reciters
+
+SAMPLE_RATE = 16000
+FRAME_MS = 20
+HOP_MS = 10
+MIN_PAUSE_MS = 40
+# Cost of one boundary landing a whole ayah-length away from its expected position
+POSITION_WEIGHT = 1.0
+# Cost of placing a boundary where there is no pause at all
+NO_PAUSE_PENALTY = 0.5
+# Energy dips between words spoken without a pause: lowest frame within
+# +-DIP_RADIUS frames, at least DIP_DB below the loudest one
+DIP_RADIUS = 8
+DIP_DB = 6.0
+ARABIC_LETTER = re.compile(r'[ء-ي]')
+
+
+def pcm_to_float(raw, width):
+    """Little-endian PCM samples (8-bit unsigned, 16/24/32-bit signed) as float32 in [-1, 1)."""
+    raw = raw[:len(raw) - len(raw) % width]
+    if width == 3:
+        # Place each 3-byte sample in the top of an int32; the shift sign-extends it
+        padded = np.zeros((len(raw) // 3, 4), dtype=np.uint8)
+        padded[:, 1:] = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3)
+        ints = padded.view('<i4').ravel() >> 8
+    elif width in (1, 2, 4):
+        ints = np.frombuffer(raw, dtype={1: np.uint8, 2: '<i2', 4: '<i4'}[width])
+    else:
+        raise RuntimeError(f'unsupported sample width: {width} bytes')
+    samples = ints.astype(np.float32)
+    if width == 1:
+        samples -= 128
+    return samples / float(2 ** (8 * width - 1))
+
+
+def read_audio(path):
+    """Decode a WAV (stdlib) or MP3 (optional audioread) file to mono float32 at SAMPLE_RATE."""
+    path = Path(path)
+    if path.suffix.lower() == '.wav':
+        with wave.open(str(path), 'rb') as f:
+            rate, channels, width = f.getframerate(), f.getnchannels(), f.getsampwidth()
+            raw = f.readframes(f.getnframes())
+        samples = pcm_to_float(raw, width)
+    else:
+        try:
+            import audioread
+        except ImportError:
+            raise RuntimeError(f"{path.name}: MP3 decoding needs the 'audioread' package") from None
+        with audioread.audio_open(str(path)) as f:
+            rate, channels = f.samplerate, f.channels
+            raw = b''.join(f)
+        samples = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768
+    if channels > 1:
+        samples = samples[:len(samples) - len(samples) % channels].reshape(-1, channels).mean(axis=1)
+    if rate != SAMPLE_RATE:
+        positions = np.arange(0, len(samples), rate / SAMPLE_RATE)
+        samples = np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+    return samples
+
+
+def frame_energy_db(samples):
+    """RMS energy per frame in dB, from a strided (frames x frame length) view."""
+    frame = SAMPLE_RATE * FRAME_MS // 1000
+    hop = SAMPLE_RATE * HOP_MS // 1000
+    if len(samples) < frame:
+        samples = np.pad(samples, (0, frame - len(samples)))
+    frames = np.lib.stride_tricks.sliding_window_view(samples, frame)[::hop]
+    rms = np.sqrt(np.mean(frames.astype(np.float64) ** 2, axis=1))
+    return 20 * np.log10(rms + 1e-10)
+
+
+def energy_levels(energy):
+    """(floor, peak, silence threshold) in dB for one recording."""
+    floor, peak = np.percentile(energy, [10, 95])
+    return floor, peak, floor + 0.3 * (peak - floor)
+
+
+def silence_runs(energy):
+    """(start frame, end frame, depth 0-1) of every silent run, from an adaptive threshold."""
+    floor, peak, threshold = energy_levels(energy)
+    silent = np.concatenate([[False], energy < threshold, [False]])
+    edges = np.flatnonzero(np.diff(silent.astype(np.int8)))
+    starts, ends = edges[::2], edges[1::2]
+    if len(starts) == 0:
+        return starts, ends, np.zeros(0)
+    depth = np.array([threshold - energy[s:e].mean() for s, e in zip(starts, ends)])
+    return starts, ends, np.clip(depth / max(peak - floor, 1e-6), 0, 1)
+
+
+def energy_dips(energy, first, last):
+    """(frame, depth 0-1) of local energy minima above the silence threshold in [first, last)."""
+    floor, peak, threshold = energy_levels(energy)
+    padded = np.pad(energy, DIP_RADIUS, mode='edge')
+    windows = np.lib.stride_tricks.sliding_window_view(padded, 2 * DIP_RADIUS + 1)
+    drop = windows.max(axis=1) - energy
+    frames = np.arange(len(energy))
+    is_dip = ((energy == windows.min(axis=1)) & (drop >= DIP_DB) & (energy >= threshold)
+              & (frames > first) & (frames < last))
+    dips = np.flatnonzero(is_dip)
+    return dips, np.clip(drop[dips] / max(peak - floor, 1e-6), 0, 1)
+
+
+def word_weights(words):
+    """Expected relative duration of each word: its letter count (at least 1)."""
+    return np.array([max(1, len(ARABIC_LETTER.findall(w))) for w in words], dtype=np.float64)
+
+
+def segment(samples, weights):
+    """Return (start_ms, end_ms, confidence) arrays with one entry per word."""
+    n = len(weights)
+    energy = frame_energy_db(samples)
+    starts, ends, depth = silence_runs(energy)
+    total = len(energy)
+
+    # Speech span: strip leading/trailing silence
+    speech_start = ends[0] if len(starts) and starts[0] == 0 else 0
+    speech_end = starts[-1] if len(starts) and ends[-1] == total else total
+    if speech_end <= speech_start:
+        speech_start, speech_end = 0, total
+    inner = (starts > speech_start) & (ends < speech_end) & ((ends - starts) * HOP_MS >= MIN_PAUSE_MS)
+    run_starts, run_ends, run_depth = starts[inner], ends[inner], depth[inner]
+
+    span = speech_end - speech_start
+    expected = speech_start + span * np.cumsum(weights)[:-1] / weights.sum()
+    if n == 1:
+        word_ends, word_starts, conf = np.zeros(0), np.zeros(0), np.zeros(0)
+    else:
+        # Candidates: every pause, weaker energy dips where words run together,
+        # and the expected positions as a last-resort fallback
+        duration = (run_ends - run_starts) * HOP_MS
+        pause_score = run_depth * (1 - np.exp(-duration / 120))
+        dips, dip_depth = energy_dips(energy, speech_start, speech_end)
+        dip_score = 0.25 * dip_depth
+        cand_pos = np.concatenate([(run_starts + run_ends) / 2, dips, expected])
+        cand_from = np.concatenate([run_starts, dips, expected])
+        cand_to = np.concatenate([run_ends, dips, expected])
+        cand_score = np.concatenate([pause_score, dip_score, np.full(n - 1, -NO_PAUSE_PENALTY)])
+        order = np.argsort(cand_pos, kind='stable')
+        cand_pos, cand_from, cand_to, cand_score = (
+            cand_pos[order], cand_from[order], cand_to[order], cand_score[order])
+
+        # cost[i, j]: boundary i placed on candidate j
+        distance = np.abs(cand_pos[None, :] - expected[:, None]) / span
+        cost = POSITION_WEIGHT * distance - cand_score[None, :]
+        m = len(cand_pos)
+        total_cost = np.full((n - 1, m), np.inf)
+        choice = np.zeros((n - 1, m), dtype=np.int64)
+        total_cost[0] = cost[0]
+        for i in range(1, n - 1):
+            # Best strictly-earlier candidate for the previous boundary, via a running minimum
+            prev = np.concatenate([[np.inf], total_cost[i - 1][:-1]])
+            best_prev = np.minimum.accumulate(prev)
+            arg = np.concatenate([[0], np.arange(m - 1)])
+            arg_best = np.maximum.accumulate(np.where(prev == best_prev, arg, 0))
+            total_cost[i] = cost[i] + best_prev
+            choice[i] = arg_best
+        picked = np.zeros(n - 1, dtype=np.int64)
+        picked[-1] = int(np.argmin(total_cost[-1]))
+        for i in range(n - 2, 0, -1):
+            picked[i - 1] = choice[i, picked[i]]
+        # A word ends where the pause before the next one begins
+        word_ends, word_starts = cand_from[picked], cand_to[picked]
+        # Confidence: how clear the chosen pause is, discounted by its drift from the letter-count estimate
+        clarity = 1 - np.exp(-6 * np.maximum(cand_score[picked], 0))
+        conf = clarity * np.exp(-4 * distance[np.arange(n - 1), picked])
+
+    start_frames = np.concatenate([[speech_start], word_starts])
+    end_frames = np.concatenate([word_ends, [speech_end]])
+    edge_conf = np.concatenate([[1.0], conf, [1.0]])
+    start_ms = np.round(start_frames * HOP_MS).astype(np.int64)
+    end_ms = np.round(end_frames * HOP_MS + (FRAME_MS - HOP_MS)).astype(np.int64)
+    confidence = np.minimum(edge_conf[:-1], edge_conf[1:])
+    return start_ms, end_ms, confidence
+
+
+def time_ayah(job):
+    """Worker: (surah, ayah, audio path, words) -> (surah, ayah, timing dict or error)."""
+    surah, ayah, path, words = job
+    try:
+        start, end, confidence = segment(read_audio(path), word_weights(words))
+    except Exception as error:  # one unreadable file must not abort the batch
+        return surah, ayah, f'{Path(path).name}: {type(error).__name__}: {error}'
+    return surah, ayah, {
+        'start': start.tolist(),
+        'end': end.tolist(),
+        'confidence': np.round(confidence, 2).tolist(),
+    }
+
+
+def find_audio(audio_dir, surah, ayah):
+    for suffix in ('.wav', '.mp3'):
+        path = Path(audio_dir) / f'{surah:03d}{ayah:03d}{suffix}'
+        if path.exists():
+            return path
+    return None
+
+
+def synthetic_ayah(rng, n_words, join_rate=0.0, noise=0.002):
+    """
+    Tone bursts (one per word) separated by short pauses, with background noise.
+    With join_rate, that share of words follows the previous one with no pause.
+    Returns (samples, words, [(start ms, end ms)], joined flag per word).
+    """
+    pieces, bounds, joined, t = [rng.normal(0, noise, int(0.3 * SAMPLE_RATE))], [], [], 0.3
+    words = []
+    for i in range(n_words):
+        letters = int(rng.integers(2, 8))
+        duration = 0.08 * letters + rng.uniform(0, 0.1)
+        tone = np.arange(int(duration * SAMPLE_RATE)) / SAMPLE_RATE
+        burst = 0.4 * np.sin(2 * np.pi * rng.uniform(120, 400) * tone) * np.hanning(len(tone)) ** 0.2
+        pieces.append(burst + rng.normal(0, noise, len(tone)))
+        bounds.append((t, t + duration))
+        t += duration
+        joined.append(i > 0 and bool(pieces[-2].size == 0))
+        gap = 0.0 if i < n_words - 1 and rng.random() < join_rate else rng.uniform(0.08, 0.25)
+        pieces.append(rng.normal(0, noise, int(gap * SAMPLE_RATE)))
+        t += gap
+        words.append('ب' * letters)
+    return np.concatenate(pieces).astype(np.float32), words, np.array(bounds) * 1000, np.array(joined)
+
+
+def _bench_job(args):
+    seed, n_words, join_rate, noise = args
+    samples, words, truth, joined = synthetic_ayah(np.random.default_rng(seed), n_words, join_rate, noise)
+    start, end, confidence = segment(samples, word_weights(words))
+    paused = ~joined
+    paused[0] = False  # the first start is the speech onset, not a boundary
+    return {
+        'error': np.abs(start - truth[:, 0])[~joined],
+        'paused_conf': confidence[paused],
+        'joined_conf': confidence[joined],
+        'joined_error': np.abs(start - truth[:, 0])[joined],
+        'seconds': len(samples) / SAMPLE_RATE,
+    }
+
+
+# (name, share of words run together, noise amplitude)
+BENCHMARK_CASES = (('clean', 0.0, 0.002), ('joined words + noise', 0.15, 0.01))
+
+
+def benchmark(count, jobs, max_error_ms):
+    """Time and check segmentation on synthetic ayat; returns False when a check fails."""
+    rng = np.random.default_rng(0)
+    sizes = [int(rng.integers(3, 30)) for _ in range(count)]
+    ok = True
+    for name, join_rate, noise in BENCHMARK_CASES:
+        work = [(seed, n, join_rate, noise) for seed, n in enumerate(sizes)]
+        begin = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(_bench_job, work, chunksize=8))
+        elapsed = time.perf_counter() - begin
+        errors = np.concatenate([r['error'] for r in results])
+        paused_conf = np.concatenate([r['paused_conf'] for r in results])
+        joined_conf = np.concatenate([r['joined_conf'] for r in results])
+        audio_seconds = sum(r['seconds'] for r in results)
+        print(f"{name}: {count} synthetic ayat ({audio_seconds:.0f} s of audio, {sum(sizes)} words), {jobs} workers")
+        print(f"  throughput: {count / elapsed:.1f} ayat/s ({audio_seconds / elapsed:.0f}x real time)")
+        print(f"  start error after a pause: mean {errors.mean():.1f} ms, 95th percentile "
+              f"{np.percentile(errors, 95):.1f} ms")
+        if np.percentile(errors, 95) > max_error_ms:
+            print(f"  FAILED: 95th percentile start error is over {max_error_ms} ms")
+            ok = False
+        if joined_conf.size:
+            joined_errors = np.concatenate([r['joined_error'] for r in results])
+            print(f"  start error with no pause: mean {joined_errors.mean():.1f} ms")
+            print(f"  mean confidence: {paused_conf.mean():.2f} after a pause, {joined_conf.mean():.2f} when joined")
+            if joined_conf.mean() >= paused_conf.mean():
+                print("  FAILED: joined words are not less confident than words after a pause")
+                ok = False
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Extract per-word timings from ayah recitations.')
+    parser.add_argument('--audio-dir', help='directory of SSSAAA.wav/.mp3 recitation files')
+    parser.add_argument('--reciter', choices=sorted(load_reciters()['reciters']),
+                        help='reciter id for the output table (default: reciters.json default)')
+    parser.add_argument('--out', default=str(ROOT / 'public' / 'data' / 'timings'), help='output directory')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(), help='worker processes')
+    parser.add_argument('--benchmark', type=int, metavar='AYAT', help='time and check N synthetic ayat instead')
+    parser.add_argument('--max-error', type=float, default=40, metavar='MS',
+                        help='benchmark fails when the 95th percentile start error exceeds this')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        sys.exit(0 if benchmark(args.benchmark, args.jobs, args.max_error) else 1)
+    if not args.audio_dir:
+        parser.error('--audio-dir is required')
+
+    reciter = args.reciter or load_reciters()['default']
+    jobs = []
+    for number, surah in load_corpus(include_inline=True).items():
+        for verse in surah['verses']:
+            path = find_audio(args.audio_dir, number, verse['verse'])
+            if path and verse.get('words'):
+                jobs.append((number, verse['verse'], str(path), [w['arabic'] for w in verse['words']]))
+
+    begin = time.perf_counter()
+    tables, failures = {}, 0
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        for surah, ayah, result in pool.map(time_ayah, jobs, chunksize=4):
+            if isinstance(result, str):
+                print(f"  {surah}:{ayah}: {result}")
+                failures += 1
+                continue
+            tables.setdefault(surah, {})[str(ayah)] = result
+    elapsed = time.perf_counter() - begin
+
+    out_dir = Path(args.out) / reciter
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for surah, ayat in tables.items():
+        data = {'surah': surah, 'reciter': reciter, 'ayat': ayat}
+        (out_dir / f'{surah}.json').write_text(json.dumps(data, separators=(',', ':')))
+    done = len(jobs) - failures
+    rate = done / elapsed if elapsed else 0
+    print(f"Timed {done} ayat ({failures} failed) for {len(tables)} surah(s) in {elapsed:.1f} s, {rate:.1f} ayat/s")
+
+
+if __name__ == '__main__':
+    main()